@@ -9,6 +9,7 @@ Requirements:
 - Flask
 - GDAL/OGR Python bindings
 - werkzeug (for secure file handling)
+- orjson (optional, faster JSON responses)
 
 Usage:
     python app.py
@@ -16,19 +17,31 @@ Usage:
 
 import os
 import sys
+import hashlib
 import tempfile
 import shutil
-from pathlib import Path
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import logging
+import uuid
+from itertools import chain
 from datetime import datetime
 
-from flask import Flask, request, jsonify, render_template_string, send_from_directory
+from flask import Flask, Request, Response, request, jsonify, render_template_string, send_from_directory, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 from werkzeug.exceptions import RequestEntityTooLarge
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import our shapefile validator
 try:
-    from shapefile_validator import ShapefileValidator
+    from shapefile_validator import ShapefileValidator, join_lines
 except ImportError:
     print("ERROR: shapefile_validator.py not found in the current directory.")
     print("Please ensure the ShapefileValidator class is available.")
@@ -39,6 +52,83 @@ app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max file size
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['SECRET_KEY'] = 'your-secret-key-change-this-in-production'
+# Validation processes per gunicorn worker. Each gunicorn worker has its own pool,
+# so split the cores between them (gunicorn reads WEB_CONCURRENCY as --workers)
+app.config['VALIDATION_WORKERS'] = max(1, (os.cpu_count() or 1) // int(os.environ.get('WEB_CONCURRENCY', 1)))
+app.config['UPLOAD_BUFFER_SIZE'] = 1024 * 1024  # Write uploads to disk in 1MB chunks
+app.config['VALIDATION_CACHE_DIR'] = '.valcache'  # Persistent results cache (requires diskcache)
+
+class HashingFile:
+    """File wrapper that hashes everything written through it with BLAKE2b."""
+    
+    def __init__(self, file):
+        self._file = file
+        self.digest = hashlib.blake2b()
+    
+    def write(self, data):
+        self.digest.update(data)
+        return self._file.write(data)
+    
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+class UploadRequest(Request):
+    """
+    Request that streams uploaded files straight into the upload folder.
+    
+    Werkzeug's default stream factory spools uploads to a temporary file (or
+    memory) which file.save() then copies again. Writing each part directly to
+    an in-flight file in the upload folder avoids that copy, and the /tmp
+    dependency with it; the view renames the file once parsing completes.
+    The content hash is computed on the way in, so the file is never re-read
+    to key the result cache or the in-flight table.
+    
+    Every stream opened is recorded in inflight_streams so that teardown can
+    delete whatever the view did not rename: extra file fields, requests
+    rejected before the upload was stored, and parses aborted partway through.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.inflight_streams = []
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        inflight_path = os.path.join(app.config['UPLOAD_FOLDER'], f"inflight_{uuid.uuid4().hex}.upload")
+        stream = HashingFile(open(inflight_path, 'w+b', buffering=app.config['UPLOAD_BUFFER_SIZE']))
+        self.inflight_streams.append(stream)
+        return stream
+
+app.request_class = UploadRequest
+
+@app.teardown_request
+def remove_inflight_uploads(exc):
+    """Delete in-flight upload files that were not moved to their final name."""
+    for stream in getattr(request, 'inflight_streams', ()):
+        try:
+            stream.close()
+            os.remove(stream.name)
+        except FileNotFoundError:
+            pass  # Renamed by store_upload
+        except Exception as e:
+            logger.warning(f"Failed to remove in-flight upload {stream.name}: {str(e)}")
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson's C implementation for every jsonify() call."""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# Fall back to Flask's built-in encoder when orjson isn't installed
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 
 # Configure logging
 logging.basicConfig(
@@ -62,21 +152,150 @@ def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+# Validation runs in a process pool so a GDAL crash takes down a pool worker
+# rather than the request process. A sync gunicorn worker only has one request
+# in flight, so its pool runs one validation at a time; running several at once
+# across cores takes more gunicorn workers or threaded (gthread) workers.
+# The pool is created lazily so each gunicorn worker forks its own.
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_validation_executor():
+    """Return the process pool used for validation, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=app.config['VALIDATION_WORKERS'])
+        return _executor
+
+# One validator per pool worker (workers are single-threaded), so its diskcache
+# handle is opened once instead of per request; validate_zip_archive clears the
+# per-run errors/warnings/details. The shapefile driver and EPSG lookup cache are
+# class- and module-level, so they persist per process regardless.
+_validator_tls = threading.local()
+
+def get_validator():
+    """Return this thread's ShapefileValidator, creating it on first use."""
+    validator = getattr(_validator_tls, 'validator', None)
+    if validator is None:
+        validator = ShapefileValidator(cache_dir=app.config['VALIDATION_CACHE_DIR'])
+        _validator_tls.validator = validator
+    return validator
+
+def run_validation(filepath, content_hash=None):
+    """Validate an uploaded ZIP archive. Runs in a worker process, so the result must be picklable."""
+    validator = get_validator()
+    is_valid, shapefiles = validator.validate_zip_archive(filepath, content_hash)
+    return {
+        'valid': is_valid,
+        'shapefiles': shapefiles,
+        'errors': list(validator.errors),
+        'warnings': list(validator.warnings),
+        'report_lines': list(validator.iter_report_lines())
+    }
+
+# Validations currently running, keyed by upload content hash, so identical
+# concurrent uploads (e.g. client retries) share one run instead of each
+# extracting and validating. The table is per server process, so this only
+# takes effect when one process serves requests concurrently: the threaded
+# development server or gunicorn's gthread workers (--threads N). Sync workers
+# handle one request at a time and never find a matching entry; across
+# processes, repeat uploads are still served by the persistent result cache.
+# Entries are (executor, future) pairs so a waiter can tell which pool broke.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+def reset_validation_executor(broken):
+    """Drop a broken process pool so the next submit starts a fresh one."""
+    global _executor
+    with _executor_lock:
+        # Another request may already have replaced it
+        if _executor is broken:
+            _executor = None
+
+def submit_validation(filepath, content_hash):
+    """Submit a validation to the pool, retrying once on a fresh pool if it broke while idle."""
+    executor = get_validation_executor()
+    try:
+        return executor, executor.submit(run_validation, filepath, content_hash)
+    except BrokenProcessPool:
+        reset_validation_executor(executor)
+        executor = get_validation_executor()
+        return executor, executor.submit(run_validation, filepath, content_hash)
+
+def validate_in_worker(filepath, content_hash):
+    """Validate an uploaded file in the process pool and wait for the result."""
+    with _inflight_lock:
+        entry = _inflight.get(content_hash)
+        is_new = entry is None
+        if is_new:
+            entry = _inflight[content_hash] = submit_validation(filepath, content_hash)
+    executor, future = entry
+    
+    if is_new:
+        # Added outside the lock: the callback runs immediately if already done
+        future.add_done_callback(lambda done: finish_inflight(content_hash, done))
+    
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        # A worker died (e.g. GDAL crashed); start a fresh pool for the next request
+        reset_validation_executor(executor)
+        raise
+
+def finish_inflight(content_hash, future):
+    """Drop a completed validation from the in-flight table."""
+    with _inflight_lock:
+        entry = _inflight.get(content_hash)
+        if entry is not None and entry[1] is future:
+            del _inflight[content_hash]
+
 def cleanup_old_files():
     """Clean up old uploaded files (older than 1 hour)."""
     try:
-        upload_folder = Path(app.config['UPLOAD_FOLDER'])
-        current_time = datetime.now().timestamp()
+        current_time = time.time()
         
-        for file_path in upload_folder.glob('*'):
-            if file_path.is_file():
-                file_age = current_time - file_path.stat().st_mtime
-                if file_age > 3600:  # 1 hour in seconds
-                    file_path.unlink()
-                    logger.info(f"Cleaned up old file: {file_path.name}")
+        # scandir answers is_file() from the directory read (d_type) without a stat
+        with os.scandir(app.config['UPLOAD_FOLDER']) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        file_age = current_time - entry.stat().st_mtime
+                        if file_age > 3600:  # 1 hour in seconds
+                            os.remove(entry.path)
+                            logger.info(f"Cleaned up old file: {entry.name}")
+                except FileNotFoundError:
+                    # Each gunicorn worker runs its own cleanup thread, or the
+                    # upload finished meanwhile; skip it and keep going
+                    continue
     except Exception as e:
         logger.error(f"Error during cleanup: {str(e)}")
 
+_cleanup_thread = None
+_cleanup_lock = threading.Lock()
+
+def start_cleanup_thread(interval=600):
+    """Run cleanup_old_files now and then every `interval` seconds on a daemon thread."""
+    global _cleanup_thread
+    
+    def cleanup_loop():
+        while True:
+            cleanup_old_files()
+            time.sleep(interval)
+    
+    with _cleanup_lock:
+        if _cleanup_thread is None:
+            _cleanup_thread = threading.Thread(target=cleanup_loop, name='upload-cleanup', daemon=True)
+            _cleanup_thread.start()
+
+@app.before_request
+def ensure_cleanup_thread():
+    """Start the cleanup thread on the first request this process serves."""
+    # Started here rather than at import so pool workers, test clients and
+    # other importers don't get one; WSGI servers never run __main__
+    if _cleanup_thread is None:
+        start_cleanup_thread()
+
 @app.route('/')
 def index():
     """Serve the main HTML page."""
@@ -95,136 +314,179 @@ def index():
     </html>
     '''
 
-@app.route('/validate', methods=['POST'])
-def validate_shapefile():
-    """API endpoint to validate uploaded shapefile."""
-    
-    # Clean up old files before processing
-    cleanup_old_files()
+def check_upload():
+    """
+    Check that the request carries a ZIP file to validate.
     
+    Returns:
+        Tuple of (file, error_response); error_response is None if the upload is usable
+    """
     # Check if file was uploaded
     if 'file' not in request.files:
         logger.warning("No file uploaded")
-        return jsonify({
+        return None, (jsonify({
             'valid': False,
             'error': 'No file uploaded',
             'report': 'ERROR: No file was uploaded. Please select a ZIP file containing your shapefile.',
             'shapefiles': [],
             'errors': ['No file was uploaded'],
             'warnings': []
-        }), 400
+        }), 400)
     
     file = request.files['file']
     
     # Check if file was selected
     if file.filename == '':
         logger.warning("No file selected")
-        return jsonify({
+        return None, (jsonify({
             'valid': False,
             'error': 'No file selected',
             'report': 'ERROR: No file was selected. Please choose a ZIP file.',
             'shapefiles': [],
             'errors': ['No file was selected'],
             'warnings': []
-        }), 400
+        }), 400)
     
     # Check file extension
     if not allowed_file(file.filename):
         logger.warning(f"Invalid file type: {file.filename}")
-        return jsonify({
+        return None, (jsonify({
             'valid': False,
             'error': 'Invalid file type',
             'report': 'ERROR: Invalid file type. Please upload a ZIP file containing your shapefile.',
             'shapefiles': [],
             'errors': ['Invalid file type - must be ZIP'],
             'warnings': []
-        }), 400
+        }), 400)
+    
+    return file, None
+
+def upload_paths(file):
+    """
+    Pick the names an upload is stored and reported under.
     
+    Returns:
+        Tuple of (filename, unique_filename, filepath)
+    """
     # Secure the filename
     filename = secure_filename(file.filename)
     if not filename:
         filename = 'upload.zip'
     
-    # Generate unique filename to avoid conflicts
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    unique_filename = f"{timestamp}_{filename}"
+    # Generate unique filename to avoid conflicts; nanosecond resolution
+    # keeps same-second uploads of the same name apart
+    unique_filename = f"{time.time_ns():x}_{filename}"
     
-    # Save uploaded file
     filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
+    return filename, unique_filename, filepath
+
+def store_upload(file, filepath):
+    """
+    Move the streamed upload to its final name.
     
+    Returns:
+        Tuple of (size_in_bytes, content_hash)
+    """
+    file.close()
+    os.replace(file.stream.name, filepath)
+    return os.path.getsize(filepath), file.stream.digest.hexdigest()
+
+def remove_upload(filepath, unique_filename):
+    """Delete an uploaded file once it has been processed."""
     try:
-        file.save(filepath)
-        logger.info(f"File uploaded: {unique_filename} ({file.content_length} bytes)")
-        
-        # Validate the shapefile
-        validator = ShapefileValidator()
-        is_valid, shapefiles = validator.validate_zip_archive(filepath)
-        
-        # Build the report step by step
-        report_sections = []
-        
-        # Add file info
-        report_sections.append(f"Processing file: {filename}")
-        report_sections.append(f"File size: {file.content_length} bytes")
-        report_sections.append("")
-        
-        # Add shapefile discovery results
-        if shapefiles:
-            report_sections.append(f"Found {len(shapefiles)} shapefile(s):")
-            for shp in shapefiles:
-                report_sections.append(f"  - {shp}")
-            report_sections.append("")
-        else:
-            report_sections.append("❌ No shapefiles found in ZIP archive")
-            report_sections.append("")
-        
-        # Add detailed validation results from the validator
-        validation_report = validator.get_validation_report()
-        if validation_report.strip():
-            report_sections.append(validation_report)
-            report_sections.append("")
-        
-        # Add final status - this is the key fix!
-        if is_valid:
-            final_status = f"✅ VALIDATION PASSED for {filename}"
-            status_summary = "All validation checks passed successfully!"
+        if os.path.exists(filepath):
+            os.remove(filepath)
+            logger.info(f"Cleaned up uploaded file: {unique_filename}")
+    except Exception as e:
+        logger.warning(f"Failed to clean up file {unique_filename}: {str(e)}")
+
+def result_status(result, filename):
+    """Return the (final_status, status_summary) lines for a validation result."""
+    if result['valid']:
+        final_status = f"✅ VALIDATION PASSED for {filename}"
+        status_summary = "All validation checks passed successfully!"
+    else:
+        final_status = f"❌ VALIDATION FAILED for {filename}"
+        if result['errors']:
+            error_count = len(result['errors'])
+            status_summary = f"Validation failed with {error_count} error(s). See details above."
         else:
-            final_status = f"❌ VALIDATION FAILED for {filename}"
-            if validator.errors:
-                error_count = len(validator.errors)
-                status_summary = f"Validation failed with {error_count} error(s). See details above."
-            else:
-                status_summary = "Validation failed for unknown reasons."
+            status_summary = "Validation failed for unknown reasons."
+    return final_status, status_summary
+
+def report_header_lines(filename, file_size):
+    """Yield the file info lines that open the report."""
+    yield f"Processing file: {filename}"
+    yield f"File size: {file_size} bytes"
+    yield ""
+
+def report_result_lines(result, filename):
+    """Yield the shapefile discovery, validation details and final status lines of the report."""
+    # Add shapefile discovery results
+    shapefiles = result['shapefiles']
+    if shapefiles:
+        yield f"Found {len(shapefiles)} shapefile(s):"
+        for shp in shapefiles:
+            yield f"  - {shp}"
+        yield ""
+    else:
+        yield "❌ No shapefiles found in ZIP archive"
+        yield ""
+    
+    # Add detailed validation results from the validator
+    yield from result['report_lines']
+    yield ""
+    
+    # Add final status - this is the key fix!
+    final_status, status_summary = result_status(result, filename)
+    yield "=" * 50
+    yield "FINAL RESULT"
+    yield "=" * 50
+    yield final_status
+    yield ""
+    yield status_summary
+
+def log_result(result, unique_filename):
+    """Log the outcome of validating an upload."""
+    logger.info(f"Validation result for {unique_filename}: {'PASSED' if result['valid'] else 'FAILED'}")
+    if not result['valid'] and result['errors']:
+        logger.info(f"Validation errors: {result['errors']}")
+
+@app.route('/validate', methods=['POST'])
+def validate_shapefile():
+    """API endpoint to validate uploaded shapefile."""
+    file, error_response = check_upload()
+    if error_response is not None:
+        return error_response
+    
+    filename, unique_filename, filepath = upload_paths(file)
+    
+    try:
+        file_size, content_hash = store_upload(file, filepath)
+        logger.info(f"File uploaded: {unique_filename} ({file_size} bytes)")
         
-        report_sections.append("=" * 50)
-        report_sections.append("FINAL RESULT")
-        report_sections.append("=" * 50)
-        report_sections.append(final_status)
-        report_sections.append("")
-        report_sections.append(status_summary)
+        # Validate the shapefile
+        result = validate_in_worker(filepath, content_hash)
+        is_valid = result['valid']
         
-        # Combine all sections
-        full_report = "\n".join(report_sections)
+        # Combine all report sections into a single string
+        full_report = join_lines(chain(report_header_lines(filename, file_size),
+                                       report_result_lines(result, filename)))
+        _, status_summary = result_status(result, filename)
         
         # Log validation result
-        logger.info(f"Validation result for {unique_filename}: {'PASSED' if is_valid else 'FAILED'}")
-        if not is_valid and validator.errors:
-            logger.info(f"Validation errors: {validator.errors}")
+        log_result(result, unique_filename)
         
         # Clean up uploaded file
-        try:
-            os.remove(filepath)
-            logger.info(f"Cleaned up uploaded file: {unique_filename}")
-        except Exception as e:
-            logger.warning(f"Failed to clean up file {unique_filename}: {str(e)}")
+        remove_upload(filepath, unique_filename)
         
         # Return consistent response
         response_data = {
             'valid': is_valid,
             'report': full_report,
-            'shapefiles': shapefiles,
-            'errors': validator.errors,
-            'warnings': validator.warnings,
+            'shapefiles': result['shapefiles'],
+            'errors': result['errors'],
+            'warnings': result['warnings'],
             'filename': filename,
             'summary': status_summary
         }
@@ -238,11 +500,7 @@ def validate_shapefile():
         logger.error(f"Error processing file {unique_filename}: {str(e)}")
         
         # Clean up file on error
-        try:
-            if os.path.exists(filepath):
-                os.remove(filepath)
-        except:
-            pass
+        remove_upload(filepath, unique_filename)
         
         return jsonify({
             'valid': False,
@@ -255,6 +513,42 @@ def validate_shapefile():
             'summary': 'File processing failed due to an internal error.'
         }), 500
 
+@app.route('/validate/stream', methods=['POST'])
+def validate_shapefile_stream():
+    """
+    API endpoint that streams the plain-text validation report.
+    
+    The file info lines are sent before validation starts and the rest is
+    written line by line, instead of being joined into one string and
+    escaped into JSON. Upload errors are reported as JSON, as in /validate.
+    """
+    file, error_response = check_upload()
+    if error_response is not None:
+        return error_response
+    
+    filename, unique_filename, filepath = upload_paths(file)
+    
+    def generate():
+        try:
+            file_size, content_hash = store_upload(file, filepath)
+            logger.info(f"File uploaded: {unique_filename} ({file_size} bytes)")
+            
+            for line in report_header_lines(filename, file_size):
+                yield line + "\n"
+            
+            result = validate_in_worker(filepath, content_hash)
+            log_result(result, unique_filename)
+            
+            for line in report_result_lines(result, filename):
+                yield line + "\n"
+        except Exception as e:
+            logger.error(f"Error processing file {unique_filename}: {str(e)}")
+            yield f"ERROR: An error occurred while processing the file: {str(e)}\n"
+        finally:
+            remove_upload(filepath, unique_filename)
+    
+    return Response(stream_with_context(generate()), mimetype='text/plain')
+
 @app.route('/health')
 def health_check():
     """Health check endpoint."""
@@ -8,6 +8,8 @@ the validation results are properly accumulated and reported.
 Requirements:
 - Python 3.6+
 - GDAL/OGR Python bindings
+- diskcache (optional, enables the persistent validation-result cache)
+- numpy (optional, enables the per-vertex --deep coordinate check)
 """
 
 import os
@@ -16,8 +18,15 @@ import zipfile
 import tempfile
 import shutil
 import argparse
+import functools
+import hashlib
+import io
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Iterable, Iterator, List, Dict, Set, Tuple, Optional
+
+from wkb_utils import NUMPY_AVAILABLE, CoordinateBounds, collect_wkb_coordinates
 
 try:
     from osgeo import ogr, osr
@@ -30,24 +39,98 @@ except ImportError:
     print("  conda install gdal")
     sys.exit(1)
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=128)
+def _authority_from_wkt(wkt: str) -> Optional[str]:
+    """Resolve the EPSG code for a WKT definition, memoized across shapefiles."""
+    spatial_ref = osr.SpatialReference()
+    spatial_ref.ImportFromWkt(wkt)
+    
+    if spatial_ref.GetAuthorityCode(None) is None:
+        try:
+            spatial_ref.AutoIdentifyEPSG()
+        except RuntimeError:
+            pass  # Not a CRS GDAL can match to an EPSG code
+    
+    return spatial_ref.GetAuthorityCode(None)
+
+def join_lines(lines: Iterable[str]) -> str:
+    """Join report lines with newlines, writing straight into one buffer instead of collecting a list."""
+    buf = io.StringIO()
+    write = buf.write
+    separator = ""
+    for line in lines:
+        write(separator)
+        write(line)
+        separator = "\n"
+    return buf.getvalue()
+
+class ShapefileResult:
+    """Errors, warnings and details collected while validating one shapefile."""
+    
+    def __init__(self, base_name: str):
+        self.base_name = base_name
+        self.valid = True
+        self.errors = []
+        self.warnings = []
+        self.validation_details = []
+        self.extent = None  # Layer extent, computed at most once per shapefile
+        self.transient = False  # A check raised, so the result may not hold on a retry
+
 class ShapefileValidator:
     """Validates shapefiles according to specified criteria."""
     
-    REQUIRED_EXTENSIONS = {'.shp', '.shx', '.dbf', '.prj'}
-    OPTIONAL_EXTENSIONS = {'.cpg', '.sbn', '.sbx', '.fbn', '.fbx', '.ain', '.aih', '.ixs', '.mxs', '.atx', '.xml'}
+    REQUIRED_EXTENSIONS = frozenset({'.shp', '.shx', '.dbf', '.prj'})
+    OPTIONAL_EXTENSIONS = frozenset({'.cpg', '.sbn', '.sbx', '.fbn', '.fbx', '.ain', '.aih', '.ixs', '.mxs', '.atx', '.xml'})
+    SIDECAR_EXTENSIONS = REQUIRED_EXTENSIONS | OPTIONAL_EXTENSIONS  # Everything extracted per shapefile
     WGS84_EPSG = 4326
+    _DRIVER = ogr.GetDriverByName("ESRI Shapefile")
+    MAX_UNCOMPRESSED_BYTES = 500 * 1024 * 1024  # Guards against ZIP bombs filling the disk
+    MAX_WORKERS = 8  # Upper bound on shapefiles validated concurrently
+    CACHE_SIZE_LIMIT = 2 ** 30  # 1GB of cached validation results
+    CACHE_VERSION = 2  # Bump whenever a change to the checks can change a verdict
+    HASH_CHUNK_SIZE = 1024 * 1024  # Read 1MB at a time when hashing archives
+    DEEP_CHECK_BATCH_SIZE = 65536  # Vertices gathered per NumPy reduction in the deep check
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None, deep: bool = False):
+        """
+        Args:
+            cache_dir: Directory for the persistent validation-result cache.
+                Results are keyed by the archive's content hash, so re-uploads
+                of the same ZIP skip extraction entirely. Requires diskcache.
+            deep: Also check every vertex for non-finite or out-of-range
+                coordinates, not just the layer extent. Requires numpy.
+        """
+        self.deep = deep
         self.errors = []
         self.warnings = []
         self.validation_details = []  # Track individual validation steps
+        self._cache = None
+        self._transient = False  # Any shapefile in the last run hit an exception path
         
-    def validate_zip_archive(self, zip_path: str) -> Tuple[bool, List[str]]:
+        if cache_dir is not None:
+            if diskcache is None:
+                logger.warning("diskcache not installed; validation-result cache disabled")
+            else:
+                try:
+                    self._cache = diskcache.Cache(cache_dir, size_limit=self.CACHE_SIZE_LIMIT)
+                except Exception as e:
+                    logger.warning(f"Cannot open validation-result cache at {cache_dir}; cache disabled ({str(e)})")
+        
+    def validate_zip_archive(self, zip_path: str, content_hash: Optional[str] = None) -> Tuple[bool, List[str]]:
         """
         Validate a ZIP archive containing shapefile(s).
         
         Args:
             zip_path: Path to ZIP file
+            content_hash: BLAKE2b hex digest of the file, if the caller already
+                computed it; saves re-reading the archive for the cache key
             
         Returns:
             Tuple of (is_valid, list_of_shapefiles_found)
@@ -56,6 +139,7 @@ class ShapefileValidator:
         self.errors.clear()
         self.warnings.clear()
         self.validation_details.clear()
+        self._transient = False
         
         if not os.path.exists(zip_path):
             self.errors.append(f"File not found: {zip_path}")
@@ -66,143 +150,280 @@ class ShapefileValidator:
             return False, []
             
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                file_list = zip_ref.namelist()
-                
-                # Find potential shapefiles
-                shapefiles = self._find_shapefiles_in_zip(file_list)
-                
-                if not shapefiles:
-                    self.errors.append("No shapefiles found in ZIP archive")
-                    return False, []
-                
-                # Track overall validation status
-                all_shapefiles_valid = True
-                
-                # Validate each shapefile
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    zip_ref.extractall(temp_dir)
-                    
-                    for shapefile_base in shapefiles:
-                        shapefile_path = os.path.join(temp_dir, f"{shapefile_base}.shp")
-                        
-                        # Track per-shapefile validation
-                        shapefile_valid = self._validate_individual_shapefile(shapefile_path, shapefile_base)
-                        
-                        if not shapefile_valid:
-                            all_shapefiles_valid = False
-                
-                return all_shapefiles_valid, shapefiles
+            cache_key = None
+            if self._cache is not None:
+                cache_key = self._cache_key(zip_path, content_hash)
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    self.errors.extend(cached['errors'])
+                    self.warnings.extend(cached['warnings'])
+                    self.validation_details.extend(cached['validation_details'])
+                    return cached['valid'], cached['shapefiles']
+            
+            is_valid, shapefiles = self._validate_zip_contents(zip_path)
+            
+            # Exception messages can hold transient errors and temp paths
+            if cache_key is not None and not self._transient:
+                self._cache_set(cache_key, {
+                    'valid': is_valid,
+                    'shapefiles': shapefiles,
+                    'errors': list(self.errors),
+                    'warnings': list(self.warnings),
+                    'validation_details': list(self.validation_details)
+                })
+            
+            return is_valid, shapefiles
                 
         except Exception as e:
+            # Not cached: processing errors may be transient (e.g. disk full)
             self.errors.append(f"Error processing ZIP file: {str(e)}")
             return False, []
     
-    def _find_shapefiles_in_zip(self, file_list: List[str]) -> List[str]:
-        """Find shapefile base names in ZIP file list."""
-        # Get all .shp files and extract base names
-        shp_files = [f for f in file_list if f.lower().endswith('.shp')]
+    def _cache_key(self, zip_path: str, content_hash: Optional[str] = None) -> str:
+        """Hash the archive contents to key the validation-result cache."""
+        if content_hash is None:
+            digest = hashlib.blake2b()
+            with open(zip_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+            content_hash = digest.hexdigest()
+        # Results from older checks, or from the other mode, must not be reused
+        return f"v{self.CACHE_VERSION}:{content_hash}:{'deep' if self.deep else 'extent'}"
+    
+    def _cache_get(self, cache_key: str) -> Optional[dict]:
+        """Look up a cached result; a failing cache counts as a miss."""
+        try:
+            return self._cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Validation-result cache read failed; validating uncached ({str(e)})")
+            return None
+    
+    def _cache_set(self, cache_key: str, value: dict) -> None:
+        """Store a result; a failing cache (timeout, disk full, read-only) only skips caching."""
+        try:
+            self._cache.set(cache_key, value)
+        except Exception as e:
+            logger.warning(f"Validation-result cache write failed; result not cached ({str(e)})")
+    
+    def _validate_zip_contents(self, zip_path: str) -> Tuple[bool, List[str]]:
+        """Extract and validate the shapefiles in a ZIP archive."""
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            # Find potential shapefiles and the sidecar members they need
+            shapefiles, sidecars_by_base = self._find_shapefiles_in_zip(zip_ref.infolist())
+            present_exts_by_base = {base: set(sidecars) for base, sidecars in sidecars_by_base.items()}
+            
+            if not shapefiles:
+                self.errors.append("No shapefiles found in ZIP archive")
+                return False, []
+            
+            # Reject from the central directory alone, before extracting anything,
+            # when no shapefile has all of its required sidecars
+            if not any(self.REQUIRED_EXTENSIONS.issubset(present_exts_by_base[base])
+                       for base in shapefiles):
+                for base in shapefiles:
+                    missing_files = sorted(self.REQUIRED_EXTENSIONS - present_exts_by_base[base])
+                    self.errors.append(f"{base}: Missing required files: {', '.join(missing_files)}")
+                self.errors.append("No complete shapefile found in ZIP archive (requires .shp, .shx, .dbf, .prj)")
+                return False, shapefiles
+            
+            # Bound the bytes extraction can write, using the sizes declared in the
+            # central directory (zipfile never inflates a member past its file_size)
+            unique_members = {member.filename: member
+                              for sidecars in sidecars_by_base.values() for member in sidecars.values()}
+            total_size = sum(member.file_size for member in unique_members.values())
+            if total_size > self.MAX_UNCOMPRESSED_BYTES:
+                self.errors.append(f"Uncompressed shapefile size {total_size} bytes exceeds the "
+                                   f"{self.MAX_UNCOMPRESSED_BYTES} byte limit")
+                return False, shapefiles
+            
+            # Track overall validation status
+            all_shapefiles_valid = True
+            
+            # Validate each shapefile
+            with tempfile.TemporaryDirectory() as temp_dir:
+                # Only decompress the sidecars OGR will open, not the whole archive
+                paths = [(self._extract_sidecars(zip_ref, sidecars_by_base[shapefile_base],
+                                                 os.path.join(temp_dir, str(index)), shapefile_base),
+                          shapefile_base, present_exts_by_base[shapefile_base])
+                         for index, shapefile_base in enumerate(shapefiles)]
+                
+                # OGR spends most of its time in C code reading .shp/.shx/.dbf,
+                # so validating shapefiles on threads overlaps their disk reads
+                with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(paths))) as executor:
+                    results = list(executor.map(lambda p: self._validate_individual_shapefile(*p), paths))
+                
+                # Merge per-shapefile results on this thread; map() yields in
+                # submission order, so the report order matches the archive order
+                for result in results:
+                    self.errors.extend(result.errors)
+                    self.warnings.extend(result.warnings)
+                    self.validation_details.extend(result.validation_details)
+                    self._transient = self._transient or result.transient
+                    
+                    if not result.valid:
+                        all_shapefiles_valid = False
+            
+            return all_shapefiles_valid, shapefiles
+    
+    def _find_shapefiles_in_zip(self, members: List[zipfile.ZipInfo]) -> Tuple[List[str], Dict[str, Dict[str, zipfile.ZipInfo]]]:
+        """
+        Find shapefile base names and their sidecar members in a single pass.
+        
+        Sidecars are matched to a shapefile case-insensitively, by base name and
+        extension, which is why they are extracted under normalized names.
+        
+        Args:
+            members: Entries from the ZIP central directory
+            
+        Returns:
+            Tuple of (shapefile_base_names, sidecar_members_by_base_name), where
+            each base name maps lowercase extensions to ZIP members
+        """
+        sidecar_extensions = self.SIDECAR_EXTENSIONS
         shapefiles = []
+        members_by_base: Dict[str, Dict[str, zipfile.ZipInfo]] = {}
+        
+        for member in members:
+            # Handle nested directories; lowercase only the extension, not the
+            # whole path, and match it with a set lookup
+            base_name, ext = os.path.splitext(member.filename)
+            ext = ext.lower()
+            if ext == '.shp':
+                shapefiles.append(base_name)
+            if ext in sidecar_extensions:
+                members_by_base.setdefault(base_name.lower(), {})[ext] = member
         
-        for shp_file in shp_files:
-            # Handle nested directories
-            base_name = os.path.splitext(shp_file)[0]
-            shapefiles.append(base_name)
+        sidecars_by_base = {base_name: members_by_base[base_name.lower()]
+                            for base_name in shapefiles}
             
-        return shapefiles
+        return shapefiles, sidecars_by_base
     
-    def _validate_individual_shapefile(self, shapefile_path: str, base_name: str) -> bool:
-        """Validate an individual shapefile and track results."""
-        shapefile_valid = True
+    def _extract_sidecars(self, zip_ref: zipfile.ZipFile, sidecars: Dict[str, zipfile.ZipInfo],
+                          dest_dir: str, base_name: str) -> str:
+        """
+        Extract one shapefile's sidecars as <name><lowercase ext> in dest_dir.
         
-        self.validation_details.append(f"\n--- Validating: {base_name} ---")
+        Writing normalized names means OGR finds every sidecar the listing
+        matched, whatever its case in the archive (e.g. Roads.SHP with
+        roads.dbf), and taking only the basename keeps paths inside dest_dir.
+        
+        Returns:
+            Path to the extracted .shp file
+        """
+        os.makedirs(dest_dir)
+        stem = os.path.basename(base_name)
+        
+        for ext, member in sidecars.items():
+            with zip_ref.open(member) as src, open(os.path.join(dest_dir, stem + ext), 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+        
+        return os.path.join(dest_dir, stem + '.shp')
+    
+    def _validate_individual_shapefile(self, shapefile_path: str, base_name: str,
+                                       present_exts: Optional[Set[str]] = None) -> ShapefileResult:
+        """
+        Validate an individual shapefile and collect its results.
+        
+        Args:
+            shapefile_path: Path to the extracted .shp file
+            base_name: Shapefile name used in messages
+            present_exts: Sidecar extensions known from the ZIP listing; when
+                None the required files are looked up on disk instead
+        """
+        result = ShapefileResult(base_name)
+        
+        result.validation_details.append(f"\n--- Validating: {base_name} ---")
         
         # Check required files
-        if not self._check_required_files(shapefile_path, base_name):
-            shapefile_valid = False
+        if not self._check_required_files(shapefile_path, base_name, result, present_exts):
+            result.valid = False
+            return result
         
-        # Only proceed with further checks if basic files are present
-        if shapefile_valid:
+        # Open the datasource once and share the layer across all checks
+        datasource = None
+        try:
+            datasource = self._DRIVER.Open(shapefile_path, 0)
+        except Exception as e:
+            result.errors.append(f"Cannot open shapefile: {shapefile_path} ({str(e)})")
+            result.valid = False
+            result.transient = True
+            return result
+        
+        if datasource is None:
+            result.errors.append(f"Cannot open shapefile: {shapefile_path}")
+            result.valid = False
+            return result
+        
+        try:
+            layer = datasource.GetLayer()
+            
             # Check coordinate system
-            if not self._check_coordinate_system(shapefile_path):
-                shapefile_valid = False
+            if not self._check_coordinate_system(layer, result):
+                result.valid = False
             
             # Check geometry types
-            if not self._check_geometry_types(shapefile_path):
-                shapefile_valid = False
+            if not self._check_geometry_types(layer, result):
+                result.valid = False
             
             # Check coordinate format
-            if not self._check_coordinate_format(shapefile_path):
-                shapefile_valid = False
+            if not self._check_coordinate_format(layer, result):
+                result.valid = False
+            
+            # Optionally check every vertex, not just the extent
+            if self.deep and not self._deep_check_coordinate_format(layer, result):
+                result.valid = False
+        finally:
+            datasource = None
         
-        return shapefile_valid
+        return result
     
-    def _check_required_files(self, shapefile_path: str, base_name: str) -> bool:
+    def _check_required_files(self, shapefile_path: str, base_name: str, result: ShapefileResult,
+                              present_exts: Optional[Set[str]] = None) -> bool:
         """Check if all required files are present."""
-        base_path = os.path.splitext(shapefile_path)[0]
-        missing_files = []
-        
-        for ext in self.REQUIRED_EXTENSIONS:
-            file_path = base_path + ext
-            if not os.path.exists(file_path):
-                missing_files.append(ext)
+        if present_exts is not None:
+            # Answer from the ZIP listing without touching the filesystem
+            missing_files = sorted(self.REQUIRED_EXTENSIONS - present_exts)
+        else:
+            base_path = os.path.splitext(shapefile_path)[0]
+            missing_files = [ext for ext in self.REQUIRED_EXTENSIONS
+                             if not os.path.exists(base_path + ext)]
         
         if missing_files:
-            self.errors.append(f"{base_name}: Missing required files: {', '.join(missing_files)}")
+            result.errors.append(f"{base_name}: Missing required files: {', '.join(missing_files)}")
             return False
         
-        self.validation_details.append("✓ All required files present (.shp, .shx, .dbf, .prj)")
+        result.validation_details.append("✓ All required files present (.shp, .shx, .dbf, .prj)")
         return True
     
-    def _check_coordinate_system(self, shapefile_path: str) -> bool:
+    def _check_coordinate_system(self, layer: ogr.Layer, result: ShapefileResult) -> bool:
         """Check if coordinate system is WGS84/EPSG:4326."""
-        datasource = None
         try:
-            driver = ogr.GetDriverByName("ESRI Shapefile")
-            datasource = driver.Open(shapefile_path, 0)
-            
-            if datasource is None:
-                self.errors.append(f"Cannot open shapefile: {shapefile_path}")
-                return False
-            
-            layer = datasource.GetLayer()
             spatial_ref = layer.GetSpatialRef()
             
             if spatial_ref is None:
-                self.errors.append("No spatial reference system found")
+                result.errors.append("No spatial reference system found")
                 return False
             
             # Check if it's WGS84
-            authority_code = spatial_ref.GetAuthorityCode(None)
+            authority_code = _authority_from_wkt(spatial_ref.ExportToWkt())
             if authority_code == str(self.WGS84_EPSG):
-                self.validation_details.append(f"✓ Coordinate system is WGS84 (EPSG:{self.WGS84_EPSG})")
+                result.validation_details.append(f"✓ Coordinate system is WGS84 (EPSG:{self.WGS84_EPSG})")
                 return True
             
             # Try to identify the CRS
             crs_name = spatial_ref.GetAttrValue("GEOGCS") or "Unknown"
             
-            self.errors.append(f"Coordinate system is not WGS84. Found: {crs_name} (EPSG:{authority_code})")
+            result.errors.append(f"Coordinate system is not WGS84. Found: {crs_name} (EPSG:{authority_code})")
             return False
             
         except Exception as e:
-            self.errors.append(f"Error checking coordinate system: {str(e)}")
+            result.errors.append(f"Error checking coordinate system: {str(e)}")
+            result.transient = True
             return False
-        finally:
-            if datasource is not None:
-                datasource = None
     
-    def _check_geometry_types(self, shapefile_path: str) -> bool:
+    def _check_geometry_types(self, layer: ogr.Layer, result: ShapefileResult) -> bool:
         """Check for 3D (Z) or measured (M) geometry types."""
-        datasource = None
         try:
-            driver = ogr.GetDriverByName("ESRI Shapefile")
-            datasource = driver.Open(shapefile_path, 0)
-            
-            if datasource is None:
-                return False
-            
-            layer = datasource.GetLayer()
-            
             # Check geometry type
             geom_type = layer.GetGeomType()
             geom_name = ogr.GeometryTypeToName(geom_type)
@@ -212,108 +433,179 @@ class ShapefileValidator:
             has_m = ogr.GT_HasM(geom_type)
             
             if has_z:
-                self.errors.append(f"3D geometry (Z values) detected: {geom_name}")
+                result.errors.append(f"3D geometry (Z values) detected: {geom_name}")
                 return False
             
             if has_m:
-                self.errors.append(f"Measured geometry (M values) detected: {geom_name}")
+                result.errors.append(f"Measured geometry (M values) detected: {geom_name}")
                 return False
             
-            self.validation_details.append(f"✓ Geometry type is valid: {geom_name}")
+            result.validation_details.append(f"✓ Geometry type is valid: {geom_name}")
             return True
             
         except Exception as e:
-            self.errors.append(f"Error checking geometry types: {str(e)}")
+            result.errors.append(f"Error checking geometry types: {str(e)}")
+            result.transient = True
             return False
-        finally:
-            if datasource is not None:
-                datasource = None
     
-    def _check_coordinate_format(self, shapefile_path: str) -> bool:
+    def _check_coordinate_format(self, layer: ogr.Layer, result: ShapefileResult) -> bool:
         """Check if coordinates are in decimal degrees format."""
-        datasource = None
         try:
-            driver = ogr.GetDriverByName("ESRI Shapefile")
-            datasource = driver.Open(shapefile_path, 0)
-            
-            if datasource is None:
-                return False
-            
-            layer = datasource.GetLayer()
-            
             # Get extent to check coordinate ranges
-            extent = layer.GetExtent()
-            min_x, max_x, min_y, max_y = extent
+            min_x, max_x, min_y, max_y = self._get_extent(layer, result)
             
             # Check if coordinates are in reasonable decimal degree ranges
             # Longitude: -180 to 180, Latitude: -90 to 90
             if not (-180 <= min_x <= 180 and -180 <= max_x <= 180):
-                self.errors.append(f"Longitude values outside valid range: {min_x:.6f} to {max_x:.6f}")
+                result.errors.append(f"Longitude values outside valid range: {min_x:.6f} to {max_x:.6f}")
                 return False
             
             if not (-90 <= min_y <= 90 and -90 <= max_y <= 90):
-                self.errors.append(f"Latitude values outside valid range: {min_y:.6f} to {max_y:.6f}")
+                result.errors.append(f"Latitude values outside valid range: {min_y:.6f} to {max_y:.6f}")
                 return False
             
-            self.validation_details.append(f"✓ Coordinates are in decimal degrees (Extent: {min_x:.6f}, {min_y:.6f}, {max_x:.6f}, {max_y:.6f})")
+            result.validation_details.append(f"✓ Coordinates are in decimal degrees (Extent: {min_x:.6f}, {min_y:.6f}, {max_x:.6f}, {max_y:.6f})")
             return True
             
         except Exception as e:
-            self.errors.append(f"Error checking coordinate format: {str(e)}")
+            result.errors.append(f"Error checking coordinate format: {str(e)}")
+            result.transient = True
             return False
-        finally:
-            if datasource is not None:
-                datasource = None
+    
+    def _deep_check_coordinate_format(self, layer: ogr.Layer, result: ShapefileResult) -> bool:
+        """Check every vertex is a finite decimal-degree coordinate."""
+        if not NUMPY_AVAILABLE:
+            result.warnings.append("numpy not installed; skipped per-vertex coordinate check")
+            return True
+        
+        try:
+            bounds = CoordinateBounds()
+            pending = []
+            pending_vertices = 0
+            
+            layer.ResetReading()
+            for feature in layer:
+                geometry = feature.GetGeometryRef()
+                if geometry is None or geometry.IsEmpty():
+                    continue
+                
+                # Parse the WKB structure in Python, but gather the coordinate runs
+                # of many features and reduce them with NumPy in one pass
+                first_run = len(pending)
+                collect_wkb_coordinates(geometry.ExportToIsoWkb(ogr.wkbNDR), 0, pending)
+                pending_vertices += sum(len(run) for run in pending[first_run:])
+                if pending_vertices >= self.DEEP_CHECK_BATCH_SIZE:
+                    bounds.add(pending)
+                    pending = []
+                    pending_vertices = 0
+            bounds.add(pending)
+            layer.ResetReading()
+            
+            min_x, max_x, min_y, max_y = bounds.min_x, bounds.max_x, bounds.min_y, bounds.max_y
+            non_finite = bounds.non_finite
+            
+            if non_finite:
+                result.errors.append(f"{non_finite} vertices have non-finite coordinates")
+                return False
+            
+            if bounds.empty:
+                result.validation_details.append("✓ No vertices to check")
+                return True
+            
+            if not (-180 <= min_x and max_x <= 180):
+                result.errors.append(f"Vertex longitudes outside valid range: {min_x:.6f} to {max_x:.6f}")
+                return False
+            
+            if not (-90 <= min_y and max_y <= 90):
+                result.errors.append(f"Vertex latitudes outside valid range: {min_y:.6f} to {max_y:.6f}")
+                return False
+            
+            result.validation_details.append("✓ All vertices are finite decimal-degree coordinates")
+            return True
+            
+        except Exception as e:
+            result.errors.append(f"Error checking vertex coordinates: {str(e)}")
+            result.transient = True
+            return False
+    
+    def _get_extent(self, layer: ogr.Layer, result: ShapefileResult) -> Tuple[float, float, float, float]:
+        """
+        Get the layer extent, preferring the cheap header value.
+        
+        With force=0 the shapefile driver reads the bounding box from the .shp
+        header instead of walking every geometry; fall back to a full scan only
+        when the quick path has no answer. can_return_null makes that case
+        come back as None rather than an empty (0, 0, 0, 0) envelope.
+        """
+        if result.extent is None:
+            try:
+                extent = layer.GetExtent(force=0, can_return_null=True)
+            except RuntimeError:
+                extent = None
+            
+            if extent is None:
+                logger.warning(f"{result.base_name}: no cached extent, scanning all features")
+                extent = layer.GetExtent(force=1)
+            
+            result.extent = extent
+        
+        return result.extent
     
     def get_validation_report(self) -> str:
         """Generate a comprehensive validation report."""
-        report = []
-        
+        return join_lines(self.iter_report_lines())
+    
+    def iter_report_lines(self) -> Iterator[str]:
+        """Yield the lines of the validation report one at a time."""
         # Add validation details (step-by-step results)
         if self.validation_details:
-            report.extend(self.validation_details)
-            report.append("")
+            yield from self.validation_details
+            yield ""
         
         # Add errors if any
         if self.errors:
-            report.append("ERRORS:")
+            yield "ERRORS:"
             for error in self.errors:
-                report.append(f"  ❌ {error}")
-            report.append("")
+                yield f"  ❌ {error}"
+            yield ""
         
         # Add warnings if any
         if self.warnings:
-            report.append("WARNINGS:")  
+            yield "WARNINGS:"
             for warning in self.warnings:
-                report.append(f"  ⚠️  {warning}")
-            report.append("")
+                yield f"  ⚠️  {warning}"
+            yield ""
         
         # Add validation summary (but not final pass/fail status)
         if not self.errors and not self.warnings:
-            report.append("All validation checks completed successfully.")
+            yield "All validation checks completed successfully."
         elif self.errors:
             error_count = len(self.errors)
             warning_count = len(self.warnings)
             if warning_count > 0:
-                report.append(f"Validation completed with {error_count} error(s) and {warning_count} warning(s).")
+                yield f"Validation completed with {error_count} error(s) and {warning_count} warning(s)."
             else:
-                report.append(f"Validation completed with {error_count} error(s).")
+                yield f"Validation completed with {error_count} error(s)."
         elif self.warnings:
             warning_count = len(self.warnings)
-            report.append(f"Validation completed with {warning_count} warning(s) but no errors.")
-        
-        return "\n".join(report)
+            yield f"Validation completed with {warning_count} warning(s) but no errors."
+
+def _validate_one(zip_path: str, cache_dir: Optional[str] = None, deep: bool = False) -> Tuple[str, bool, str]:
+    """Validate one ZIP archive in a batch worker process and return (zip_path, is_valid, report)."""
+    validator = ShapefileValidator(cache_dir=cache_dir, deep=deep)
+    is_valid, _ = validator.validate_zip_archive(zip_path)
+    return zip_path, is_valid, validator.get_validation_report()
 
 def main():
     parser = argparse.ArgumentParser(description="Validate shapefiles in ZIP archives")
     parser.add_argument("input", help="Path to ZIP file or directory containing ZIP files")
     parser.add_argument("--batch", action="store_true", help="Process all ZIP files in directory")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--cache-dir", help="Cache validation results by ZIP content hash in this directory")
+    parser.add_argument("--deep", action="store_true", help="Check every vertex, not just the layer extent (requires numpy)")
     
     args = parser.parse_args()
     
-    validator = ShapefileValidator()
-    
     if args.batch:
         # Process all ZIP files in directory
         if not os.path.isdir(args.input):
@@ -328,18 +620,23 @@ def main():
         print(f"Found {len(zip_files)} ZIP files to validate")
         
         all_valid = True
-        for zip_file in zip_files:
-            print(f"\n{'='*50}")
-            print(f"Processing: {zip_file.name}")
-            print(f"{'='*50}")
-            
-            is_valid, shapefiles = validator.validate_zip_archive(str(zip_file))
-            
-            if not is_valid:
-                all_valid = False
+        validate_one = functools.partial(_validate_one, cache_dir=args.cache_dir, deep=args.deep)
+        
+        # Each ZIP is validated in its own process; map() yields in submission
+        # order, so output matches a sequential run
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(validate_one, [str(zip_file) for zip_file in zip_files])
             
-            if args.verbose or not is_valid:
-                print(validator.get_validation_report())
+            for zip_file, (_, is_valid, report) in zip(zip_files, results):
+                print(f"\n{'='*50}")
+                print(f"Processing: {zip_file.name}")
+                print(f"{'='*50}")
+                
+                if not is_valid:
+                    all_valid = False
+                
+                if args.verbose or not is_valid:
+                    print(report)
         
         print(f"\n{'='*50}")
         print("BATCH SUMMARY")
@@ -355,6 +652,8 @@ def main():
             print(f"ERROR: File not found: {args.input}")
             sys.exit(1)
         
+        validator = ShapefileValidator(cache_dir=args.cache_dir, deep=args.deep)
+        
         print(f"Validating: {args.input}")
         print("="*50)
         
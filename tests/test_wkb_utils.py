@@ -0,0 +1,129 @@
+"""Tests for the GDAL-free WKB coordinate parser used by the --deep check."""
+
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from wkb_utils import CoordinateBounds, collect_wkb_coordinates
+
+
+def header(geom_type, endian='<'):
+    """Byte-order flag and geometry type of a WKB geometry."""
+    return struct.pack(endian + 'BI', 1 if endian == '<' else 0, geom_type)
+
+
+def run(points, endian='<'):
+    """Point count followed by the packed coordinates."""
+    flat = [value for point in points for value in point]
+    return struct.pack(f"{endian}I{len(flat)}d", len(points), *flat)
+
+
+def point(coords, endian='<', geom_type=1):
+    return header(geom_type, endian) + struct.pack(f"{endian}{len(coords)}d", *coords)
+
+
+def linestring(points, endian='<', geom_type=2):
+    return header(geom_type, endian) + run(points, endian)
+
+
+def polygon(rings, endian='<', geom_type=3):
+    return header(geom_type, endian) + struct.pack(endian + 'I', len(rings)) + b''.join(run(r, endian) for r in rings)
+
+
+def collection(parts, geom_type, endian='<'):
+    return header(geom_type, endian) + struct.pack(endian + 'I', len(parts)) + b''.join(parts)
+
+
+def parse(wkb):
+    arrays = []
+    end = collect_wkb_coordinates(wkb, 0, arrays)
+    assert end == len(wkb)
+    return [array.tolist() for array in arrays]
+
+
+@pytest.mark.parametrize("endian", ['<', '>'])
+def test_point_either_byte_order(endian):
+    assert parse(point((1.5, -2.25), endian)) == [[[1.5, -2.25]]]
+
+
+def test_linestring():
+    assert parse(linestring([(0, 0), (1, 2), (3, 4)])) == [[[0, 0], [1, 2], [3, 4]]]
+
+
+def test_polygon_rings_are_separate_runs():
+    shell = [(0, 0), (10, 0), (10, 10), (0, 0)]
+    hole = [(2, 2), (3, 2), (3, 3), (2, 2)]
+    assert parse(polygon([shell, hole])) == [[list(p) for p in shell], [list(p) for p in hole]]
+
+
+def test_multipolygon_with_mixed_byte_order_parts():
+    first = polygon([[(0, 0), (1, 0), (1, 1), (0, 0)]], endian='>')
+    second = polygon([[(5, 5), (6, 5), (6, 6), (5, 5)]], endian='<')
+    arrays = parse(collection([first, second], 6, endian='>'))
+    assert [ring[0] for ring in arrays] == [[0, 0], [5, 5]]
+
+
+def test_nested_geometry_collection():
+    inner = collection([point((7, 8)), linestring([(1, 1), (2, 2)])], 7)
+    assert parse(collection([inner, point((9, 9))], 7)) == [[[7, 8]], [[1, 1], [2, 2]], [[9, 9]]]
+
+
+@pytest.mark.parametrize("geom_type, coords", [
+    (1001, (1, 2, 3)),     # Point Z
+    (2001, (1, 2, 4)),     # Point M
+    (3001, (1, 2, 3, 4)),  # Point ZM
+])
+def test_point_z_and_m_dimensions(geom_type, coords):
+    assert parse(point(coords, geom_type=geom_type)) == [[list(coords)]]
+
+
+def test_linestring_zm_stride():
+    points = [(0, 1, 2, 3), (4, 5, 6, 7)]
+    assert parse(linestring(points, geom_type=3002)) == [[list(p) for p in points]]
+
+
+def test_empty_linestring():
+    assert parse(linestring([])) == [[]]
+
+
+def test_offset_into_buffer():
+    prefix = b'\xff' * 3
+    wkb = point((1, 2))
+    arrays = []
+    assert collect_wkb_coordinates(prefix + wkb, len(prefix), arrays) == len(prefix) + len(wkb)
+    assert arrays[0].tolist() == [[1, 2]]
+
+
+def test_unsupported_type():
+    with pytest.raises(ValueError):
+        collect_wkb_coordinates(header(15) + struct.pack('<I', 0), 0, [])
+
+
+def test_bounds_over_batches():
+    bounds = CoordinateBounds()
+    assert bounds.empty
+
+    arrays = []
+    collect_wkb_coordinates(linestring([(-10, 5), (20, -3)]), 0, arrays)
+    collect_wkb_coordinates(point((1, 2, 300), geom_type=1001), 0, arrays)
+    bounds.add(arrays)
+    bounds.add([])
+
+    arrays = []
+    collect_wkb_coordinates(point((179, 89)), 0, arrays)
+    bounds.add(arrays)
+
+    assert not bounds.empty
+    assert (bounds.min_x, bounds.max_x, bounds.min_y, bounds.max_y) == (-10, 179, -3, 89)
+    assert bounds.non_finite == 0
+
+
+def test_bounds_count_and_skip_non_finite():
+    arrays = []
+    collect_wkb_coordinates(linestring([(float('nan'), 0), (1, float('inf')), (2, 3)]), 0, arrays)
+    bounds = CoordinateBounds()
+    bounds.add(arrays)
+    assert bounds.non_finite == 2
+    assert (bounds.min_x, bounds.max_x, bounds.min_y, bounds.max_y) == (2, 2, 3, 3)
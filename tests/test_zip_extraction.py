@@ -0,0 +1,67 @@
+"""Tests for matching shapefile sidecars in a ZIP listing and extracting them."""
+
+import os
+import zipfile
+
+import pytest
+
+pytest.importorskip("osgeo")
+
+from shapefile_validator import ShapefileValidator
+
+
+def make_zip(path, names):
+    """Write a ZIP whose members hold their own names as content."""
+    with zipfile.ZipFile(path, 'w') as zip_ref:
+        for name in names:
+            zip_ref.writestr(name, name)
+    return path
+
+
+def test_mixed_case_sidecars_extract_under_normalized_names(tmp_path):
+    zip_path = make_zip(tmp_path / "mixed.zip",
+                        ["data/Roads.SHP", "data/roads.shx", "data/ROADS.dbf", "data/roads.Prj",
+                         "data/roads.CPG", "README.txt"])
+    validator = ShapefileValidator()
+
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        shapefiles, sidecars_by_base = validator._find_shapefiles_in_zip(zip_ref.infolist())
+        assert shapefiles == ["data/Roads"]
+        assert set(sidecars_by_base["data/Roads"]) == {'.shp', '.shx', '.dbf', '.prj', '.cpg'}
+
+        dest_dir = tmp_path / "out" / "0"
+        shp_path = validator._extract_sidecars(zip_ref, sidecars_by_base["data/Roads"],
+                                               str(dest_dir), "data/Roads")
+
+    assert shp_path == str(dest_dir / "Roads.shp")
+    assert sorted(os.listdir(dest_dir)) == ["Roads.cpg", "Roads.dbf", "Roads.prj", "Roads.shp", "Roads.shx"]
+    assert (dest_dir / "Roads.dbf").read_text() == "data/ROADS.dbf"
+
+
+def test_present_exts_match_listing_case_insensitively(tmp_path):
+    zip_path = make_zip(tmp_path / "partial.zip", ["Roads.SHP", "roads.SHX", "ROADS.dbf"])
+    validator = ShapefileValidator()
+
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        shapefiles, sidecars_by_base = validator._find_shapefiles_in_zip(zip_ref.infolist())
+
+    present_exts = set(sidecars_by_base[shapefiles[0]])
+    assert present_exts == {'.shp', '.shx', '.dbf'}
+    assert validator.REQUIRED_EXTENSIONS - present_exts == {'.prj'}
+
+
+def test_traversal_member_is_written_inside_dest_dir(tmp_path):
+    zip_path = make_zip(tmp_path / "evil.zip", ["../evil.shp", "../evil.shx", "../evil.dbf", "../evil.prj"])
+    validator = ShapefileValidator()
+    temp_dir = tmp_path / "temp"
+    temp_dir.mkdir()
+
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        shapefiles, sidecars_by_base = validator._find_shapefiles_in_zip(zip_ref.infolist())
+        assert shapefiles == ["../evil"]
+        shp_path = validator._extract_sidecars(zip_ref, sidecars_by_base["../evil"],
+                                               str(temp_dir / "0"), "../evil")
+
+    assert os.path.dirname(shp_path) == str(temp_dir / "0")
+    assert (temp_dir / "0" / "evil.shx").read_text() == "../evil.shx"
+    assert not (tmp_path / "evil.shx").exists()
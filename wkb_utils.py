@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+WKB Coordinate Helpers
+
+Parses coordinate runs out of ISO WKB geometries for the per-vertex
+(--deep) coordinate check in shapefile_validator.py. Kept free of GDAL so
+the binary parsing can be tested on its own.
+
+Requirements:
+- Python 3.6+
+- numpy
+"""
+
+import struct
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+def collect_wkb_coordinates(wkb: bytes, offset: int, arrays: list) -> int:
+    """
+    Append an (n, dims) NumPy view of each coordinate run in an ISO WKB geometry.
+    
+    Only the geometry structure (types and counts) is walked in Python; the
+    coordinates themselves are viewed in place with numpy.frombuffer.
+    
+    Args:
+        wkb: Geometry bytes, in either byte order
+        offset: Offset of the geometry's byte-order flag
+        arrays: List the coordinate runs are appended to
+    
+    Returns:
+        Offset of the first byte after the geometry
+    """
+    endian = '<' if wkb[offset] == 1 else '>'
+    geom_type, = struct.unpack_from(endian + 'I', wkb, offset + 1)
+    offset += 5
+    
+    # ISO WKB: +1000 for Z, +2000 for M, +3000 for ZM
+    dims = 2 + (geom_type // 1000 in (1, 3)) + (geom_type // 1000 in (2, 3))
+    base_type = geom_type % 1000
+    dtype = np.dtype(endian + 'f8')
+    
+    def read_run(offset: int, count: int) -> int:
+        arrays.append(np.frombuffer(wkb, dtype, count * dims, offset).reshape(count, dims))
+        return offset + count * dims * 8
+    
+    if base_type == 1:  # Point
+        return read_run(offset, 1)
+    
+    count, = struct.unpack_from(endian + 'I', wkb, offset)
+    offset += 4
+    
+    if base_type == 2:  # LineString
+        return read_run(offset, count)
+    
+    if base_type == 3:  # Polygon: count rings, each a point run
+        for _ in range(count):
+            points, = struct.unpack_from(endian + 'I', wkb, offset)
+            offset = read_run(offset + 4, points)
+        return offset
+    
+    if base_type in (4, 5, 6, 7):  # Multi* and GeometryCollection: nested WKB
+        for _ in range(count):
+            offset = collect_wkb_coordinates(wkb, offset, arrays)
+        return offset
+    
+    raise ValueError(f"Unsupported WKB geometry type: {geom_type}")
+
+class CoordinateBounds:
+    """Running x/y bounds and non-finite vertex count over batches of coordinate runs."""
+    
+    def __init__(self):
+        self.min_x = self.min_y = float('inf')
+        self.max_x = self.max_y = float('-inf')
+        self.non_finite = 0
+    
+    @property
+    def empty(self) -> bool:
+        """True until a finite vertex has been added."""
+        return self.min_x > self.max_x
+    
+    def add(self, runs: List) -> None:
+        """Fold a batch of (n, dims) coordinate runs into the bounds with one NumPy reduction."""
+        if not runs:
+            return
+        
+        coords = np.concatenate([run[:, :2] for run in runs])
+        
+        finite = np.isfinite(coords).all(axis=1)
+        finite_count = int(finite.sum())
+        if finite_count < len(coords):
+            self.non_finite += len(coords) - finite_count
+            coords = coords[finite]
+        
+        if len(coords):
+            min_x, min_y = coords.min(axis=0).tolist()
+            max_x, max_y = coords.max(axis=0).tolist()
+            self.min_x = min(self.min_x, min_x)
+            self.min_y = min(self.min_y, min_y)
+            self.max_x = max(self.max_x, max_x)
+            self.max_y = max(self.max_y, max_y)